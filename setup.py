@@ -8,6 +8,7 @@ setup(
         'PySide2>=5.15.2',
         'matplotlib>=3.5.2',
         'numpy>=1.23.1',
+        'scipy>=1.9.0',
         'sympy>=1.10.1',
     ],
     extras_require={
@@ -10,6 +10,7 @@ class Equation:
     raw_expression: str
     parsed_function: Optional[Callable] = None
     error_message: Optional[str] = None
+    variables: Tuple[str, ...] = ('x',)
 
     # Constants
     VALID_FUNCTIONS = ['log10', 'sqrt']
@@ -97,13 +98,25 @@ class Equation:
         return True
 
     def _validate_variables(self) -> bool:
-        """Validates variable usage."""
+        """Validates variable usage against the allowed variables."""
+        variable_names = '|'.join(re.escape(v) for v in sorted(self.variables, key=len, reverse=True))
 
         # Check for missing operators between terms
-        if re.search(r'\d[x]|[x]\d', self.raw_expression):
+        if re.search(rf'\d(?:{variable_names})|(?:{variable_names})\d', self.raw_expression):
             self.error_message = "Missing multiplication operator (use '*' between numbers and variables)"
             return False
 
+        # Check for identifiers that are neither functions nor allowed variables
+        found_names = re.findall(r'\b[a-zA-Z_]\w*\b(?!\s*\()', self.raw_expression)
+        unknown_names = sorted(set(n for n in found_names if n not in self.variables))
+
+        if unknown_names:
+            self.error_message = (
+                f"Unknown variable(s): {', '.join(unknown_names)}. "
+                f"Only {', '.join(self.variables)} allowed"
+            )
+            return False
+
         return True
 
     def _validate_functions(self) -> bool:
@@ -150,10 +163,14 @@ class Equation:
         expr = self.raw_expression.replace('^', '**')
         expr = expr.replace('log10', 'np.log10')
         expr = expr.replace('sqrt', 'np.sqrt')
-        return lambda x: eval(expr)
+        variables = self.variables
+        return lambda *values: eval(expr, globals(), dict(zip(variables, values)))
 
-    def evaluate(self, x_values: np.ndarray) -> np.ndarray:
-        """Evaluates the equation for given x values."""
+    def evaluate(self, x_values: np.ndarray, y_values: Optional[np.ndarray] = None) -> np.ndarray:
+        """Evaluates the equation for given x values (and y values for two-variable equations)."""
         if not self.parsed_function:
             raise ValueError("Equation not properly parsed")
-        return self.parsed_function(x_values)
\ No newline at end of file
+        values = (x_values,) if y_values is None else (x_values, y_values)
+        if len(values) != len(self.variables):
+            raise ValueError(f"Expected values for {len(self.variables)} variable(s): {', '.join(self.variables)}")
+        return self.parsed_function(*values)
\ No newline at end of file
@@ -0,0 +1,196 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from scipy.ndimage import label
+from ..models.equation import Equation
+
+class SystemSolverService:
+    """Service class for solving a system of two equations f(x, y) = 0 and g(x, y) = 0."""
+
+    def __init__(self, eq1: Equation, eq2: Equation):
+        self.eq1 = eq1
+        self.eq2 = eq2
+        self.x_range = np.linspace(-10, 10, 400)
+        self.y_range = np.linspace(-10, 10, 400)
+        self.x_grid, self.y_grid = np.meshgrid(self.x_range, self.y_range)
+        self.f_values: Optional[np.ndarray] = None
+        self.g_values: Optional[np.ndarray] = None
+        self.intersection_points: List[Tuple[float, float]] = []
+        self.curves_overlap = False
+
+        # Newton refinement settings
+        self.max_iterations = 50
+        self.step = 1e-7
+        self.tolerance = 1e-6
+
+        # Shared-contour runs longer than this many cells are overlaps, not tangencies
+        self.max_tangent_cells = 3
+
+        # Roots closer than half a cell width are the same intersection
+        self.cell_width = min(self.x_range[1] - self.x_range[0], self.y_range[1] - self.y_range[0])
+        self.duplicate_tolerance = 0.5 * self.cell_width
+
+    def _evaluate(self, eq: Equation, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Evaluates an equation over arrays of points, broadcasting constants to the input shape."""
+        with np.errstate(all='ignore'):
+            values = eq.evaluate(x, y)
+        return np.broadcast_to(np.asarray(values, dtype=float), np.shape(x))
+
+    def _gradient(self, eq: Equation, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Central-difference gradient of an equation at every point."""
+        h = self.step
+        d_x = (self._evaluate(eq, x + h, y) - self._evaluate(eq, x - h, y)) / (2 * h)
+        d_y = (self._evaluate(eq, x, y + h) - self._evaluate(eq, x, y - h)) / (2 * h)
+        return d_x, d_y
+
+    def _evaluate_mesh(self):
+        """Evaluates both equations over the mesh once and stores the values."""
+        if self.f_values is None:
+            self.f_values = self._evaluate(self.eq1, self.x_grid, self.y_grid)
+            self.g_values = self._evaluate(self.eq2, self.x_grid, self.y_grid)
+
+    def _cell_corners(self, z: np.ndarray) -> np.ndarray:
+        """Stacks the four corner values of every mesh cell."""
+        return np.stack([z[:-1, :-1], z[:-1, 1:], z[1:, :-1], z[1:, 1:]])
+
+    def _crosses_zero(self, z: np.ndarray) -> np.ndarray:
+        """Marks mesh cells whose four corners contain a sign change (marching-squares style)."""
+        corners = self._cell_corners(z)
+        finite = np.isfinite(corners).all(axis=0)
+        with np.errstate(invalid='ignore'):
+            return finite & (corners.min(axis=0) <= 0) & (corners.max(axis=0) >= 0)
+
+    def _near_zero(self, z: np.ndarray) -> np.ndarray:
+        """Marks mesh cells with a corner whose first-order distance to z = 0 is within one cell.
+
+        This catches roots where the function touches zero without changing
+        sign, either at a point or along a whole curve (double roots).
+        """
+        slope_y, slope_x = np.gradient(z, self.y_range, self.x_range)
+        with np.errstate(invalid='ignore'):
+            near = np.abs(z) <= np.hypot(slope_x, slope_y) * self.cell_width
+        return self._cell_corners(near & np.isfinite(z)).any(axis=0)
+
+    def find_candidates(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the centers of mesh cells where both functions cross or approach zero."""
+        self._evaluate_mesh()
+        f_cells = self._crosses_zero(self.f_values) | self._near_zero(self.f_values)
+        g_cells = self._crosses_zero(self.g_values) | self._near_zero(self.g_values)
+
+        rows, cols = np.nonzero(f_cells & g_cells)
+        x_centers = (self.x_range[cols] + self.x_range[cols + 1]) / 2
+        y_centers = (self.y_range[rows] + self.y_range[rows + 1]) / 2
+        return x_centers, y_centers
+
+    def _project(self, eq: Equation, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Moves every point onto the zero contour of one equation along its gradient."""
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        for _ in range(self.max_iterations):
+            z = self._evaluate(eq, x, y)
+            d_x, d_y = self._gradient(eq, x, y)
+            with np.errstate(all='ignore'):
+                scale = z / (d_x ** 2 + d_y ** 2)
+                dx = scale * d_x
+                dy = scale * d_y
+            active = np.isfinite(dx) & np.isfinite(dy) & (z != 0)
+            if not np.any(active):
+                break
+            x[active] -= dx[active]
+            y[active] -= dy[active]
+        return x, y
+
+    def _on_both_contours(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Marks points whose projection onto either zero contour also zeroes the other equation."""
+        fx, fy = self._project(self.eq1, x, y)
+        gx, gy = self._project(self.eq2, x, y)
+        with np.errstate(invalid='ignore'):
+            return (
+                (np.abs(self._evaluate(self.eq2, fx, fy)) < self.tolerance)
+                & (np.abs(self._evaluate(self.eq1, gx, gy)) < self.tolerance)
+            )
+
+    def find_overlap(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Marks candidates that belong to a connected run of cells where the curves coincide."""
+        shared = self._on_both_contours(x, y)
+        cols = np.searchsorted(self.x_range, x) - 1
+        rows = np.searchsorted(self.y_range, y) - 1
+
+        cell_mask = np.zeros((len(self.y_range) - 1, len(self.x_range) - 1), dtype=bool)
+        cell_mask[rows[shared], cols[shared]] = True
+        runs, _ = label(cell_mask, structure=np.ones((3, 3), dtype=int))
+        run_sizes = np.bincount(runs.ravel())
+        run_sizes[0] = 0
+
+        return run_sizes[runs[rows, cols]] > self.max_tangent_cells
+
+    def refine(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Refines all candidate points at once with a batched 2x2 Newton iteration.
+
+        Returns the refined coordinates and a mask of points that converged,
+        meaning both residuals and a finite Newton step are below tolerance.
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        converged = np.zeros(x.shape, dtype=bool)
+
+        for _ in range(self.max_iterations + 1):
+            f = self._evaluate(self.eq1, x, y)
+            g = self._evaluate(self.eq2, x, y)
+            f_x, f_y = self._gradient(self.eq1, x, y)
+            g_x, g_y = self._gradient(self.eq2, x, y)
+
+            # Solve J * [dx, dy] = [f, g] by Cramer's rule
+            with np.errstate(all='ignore'):
+                det = f_x * g_y - f_y * g_x
+                dx = (g_y * f - f_y * g) / det
+                dy = (f_x * g - g_x * f) / det
+                finite_step = np.isfinite(dx) & np.isfinite(dy)
+                converged = (
+                    finite_step
+                    & (np.abs(dx) < self.tolerance) & (np.abs(dy) < self.tolerance)
+                    & (np.abs(f) < self.tolerance) & (np.abs(g) < self.tolerance)
+                )
+
+            x[finite_step] -= dx[finite_step]
+            y[finite_step] -= dy[finite_step]
+            if not np.any(finite_step & ~converged):
+                break
+
+        return x, y, converged
+
+    def _deduplicate(self, x: np.ndarray, y: np.ndarray) -> List[Tuple[float, float]]:
+        """Merges points that lie within the duplicate tolerance of each other."""
+        points: List[Tuple[float, float]] = []
+        for x_solution, y_solution in zip(x, y):
+            if not any(abs(x_i - x_solution) < self.duplicate_tolerance
+                       and abs(y_i - y_solution) < self.duplicate_tolerance
+                       for x_i, y_i in points):
+                points.append((float(x_solution), float(y_solution)))
+        return points
+
+    def solve(self) -> List[Tuple[float, float]]:
+        """Finds intersection points of the two zero contours.
+
+        Candidates inside a run of cells where the curves coincide are never
+        reported as intersections; the overlap is flagged through `curves_overlap`.
+        """
+        x_candidates, y_candidates = self.find_candidates()
+        overlap = self.find_overlap(x_candidates, y_candidates)
+        self.curves_overlap = bool(np.any(overlap))
+
+        x, y, converged = self.refine(x_candidates[~overlap], y_candidates[~overlap])
+
+        # Keep converged points that stay inside the plotted region
+        valid = (
+            converged
+            & (x >= self.x_range[0]) & (x <= self.x_range[-1])
+            & (y >= self.y_range[0]) & (y <= self.y_range[-1])
+        )
+
+        self.intersection_points = self._deduplicate(x[valid], y[valid])
+        return sorted(self.intersection_points)
+
+    def get_plot_data(self) -> tuple:
+        """Returns data needed for plotting the zero contours."""
+        self._evaluate_mesh()
+        return self.x_grid, self.y_grid, self.f_values, self.g_values
@@ -1,17 +1,19 @@
 from PySide2.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QMessageBox,
-    QGroupBox, QSplitter
+    QGroupBox, QSplitter, QCheckBox
 )
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QFont, QPixmap
 import os
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
 
 from ..models.equation import Equation  
 from ..services.solver_service import SolverService
+from ..services.system_solver_service import SystemSolverService
 
 
 class EquationSolverView(QMainWindow):
@@ -117,6 +119,11 @@ class EquationSolverView(QMainWindow):
         self.eq2_input.setStyleSheet(input_style)
         self.eq2_input.setPlaceholderText("e.g. log10(x) + 3")
 
+        # Two-variable system mode
+        self.system_mode_checkbox = QCheckBox("Two-variable system: f(x, y) = 0, g(x, y) = 0")
+        self.system_mode_checkbox.setStyleSheet(label_style)
+        self.system_mode_checkbox.toggled.connect(self._update_placeholders)
+
         # Solve button
         solve_button = QPushButton("Solve and Plot")
         solve_button.setStyleSheet("""
@@ -137,12 +144,22 @@ class EquationSolverView(QMainWindow):
         layout.addWidget(self.eq1_input)
         layout.addWidget(eq2_label)
         layout.addWidget(self.eq2_input)
+        layout.addWidget(self.system_mode_checkbox)
         layout.addSpacing(5)
         layout.addWidget(solve_button)
         layout.addStretch()
 
         return group_box
 
+    def _update_placeholders(self, system_mode: bool):
+        """Update input hints to match the selected solving mode."""
+        if system_mode:
+            self.eq1_input.setPlaceholderText("e.g. x^2 + y^2 - 4")
+            self.eq2_input.setPlaceholderText("e.g. x - y")
+        else:
+            self.eq1_input.setPlaceholderText("e.g. 5*x^3 + 2*x")
+            self.eq2_input.setPlaceholderText("e.g. log10(x) + 3")
+
     def _create_plot_section(self) -> QWidget:
         """Create a widget containing the Matplotlib plot + toolbar."""
         plot_widget = QWidget()
@@ -174,10 +191,12 @@ class EquationSolverView(QMainWindow):
             # Get user input
             raw_eq1 = self.eq1_input.text().strip()
             raw_eq2 = self.eq2_input.text().strip()
+            system_mode = self.system_mode_checkbox.isChecked()
+            variables = ('x', 'y') if system_mode else ('x',)
 
             # Validate & Parse Equations
-            eq1 = Equation(raw_eq1)
-            eq2 = Equation(raw_eq2)
+            eq1 = Equation(raw_eq1, variables=variables)
+            eq2 = Equation(raw_eq2, variables=variables)
 
             if eq1.error_message or eq2.error_message:
                 QMessageBox.warning(
@@ -186,6 +205,10 @@ class EquationSolverView(QMainWindow):
                 )
                 return
 
+            if system_mode:
+                self._solve_and_plot_system(eq1, eq2, raw_eq1, raw_eq2)
+                return
+
             # Solve and get plot data
             solver = SolverService(eq1, eq2)
             intersections = solver.solve()
@@ -219,3 +242,42 @@ class EquationSolverView(QMainWindow):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error: {str(e)}")
+
+    def _solve_and_plot_system(self, eq1: Equation, eq2: Equation, raw_eq1: str, raw_eq2: str):
+        """Solve and plot the zero contours of a two-variable system with intersection points."""
+        solver = SystemSolverService(eq1, eq2)
+        intersections = solver.solve()
+        x_grid, y_grid, f_vals, g_vals = solver.get_plot_data()
+
+        # Clear previous plot
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+
+        # Plot the zero contours of both functions
+        ax.contour(x_grid, y_grid, f_vals, levels=[0], colors='blue')
+        ax.contour(x_grid, y_grid, g_vals, levels=[0], colors='green')
+        handles = [
+            Line2D([], [], color='blue', label=f'Function 1: {raw_eq1} = 0'),
+            Line2D([], [], color='green', label=f'Function 2: {raw_eq2} = 0'),
+        ]
+
+        # Plot intersection points
+        if intersections:
+            x_int, y_int = zip(*intersections)
+            handles.append(ax.scatter(x_int, y_int, color='red', s=100, zorder=5, label='Intersections'))
+            for x_i, y_i in intersections:
+                ax.annotate(f'({x_i:.2f}, {y_i:.2f})', (x_i, y_i),
+                            xytext=(10, 10), textcoords='offset points',
+                            fontsize=12, fontweight='bold', color='red')
+
+        ax.grid(True)
+        ax.legend(handles=handles)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        if solver.curves_overlap:
+            ax.set_title("System Intersection Points (curves overlap)")
+        else:
+            ax.set_title("System Intersection Points")
+
+        # Update canvas
+        self.canvas.draw()
@@ -191,3 +191,31 @@ def test_trailing_and_leading_whitespace():
     assert eq.error_message is None
 
 
+def test_valid_two_variable_equation():
+    eq = Equation("x^2 + y^2 - 4", variables=('x', 'y'))
+    assert eq.error_message is None
+
+    x = np.array([0, 2, 1])
+    y = np.array([2, 0, 1])
+    expected = x**2 + y**2 - 4
+    np.testing.assert_array_almost_equal(eq.evaluate(x, y), expected)
+
+def test_invalid_two_variable_missing_operator():
+    eq = Equation("2y + x", variables=('x', 'y'))
+    assert eq.error_message is not None
+
+def test_invalid_two_variable_unknown_variable():
+    eq = Equation("x + z", variables=('x', 'y'))
+    assert eq.error_message is not None
+
+def test_multi_character_variable_names():
+    eq = Equation("x1 + x2", variables=('x1', 'x2'))
+    assert eq.error_message is None
+
+    np.testing.assert_array_almost_equal(eq.evaluate(np.array([1, 2]), np.array([3, 4])), np.array([4, 6]))
+    assert Equation("2x1 + x2", variables=('x1', 'x2')).error_message is not None
+
+def test_evaluate_wrong_number_of_values():
+    eq = Equation("x + y", variables=('x', 'y'))
+    with pytest.raises(ValueError):
+        eq.evaluate(np.array([1, 2]))
@@ -0,0 +1,122 @@
+import pytest
+import numpy as np
+from src.models.equation import Equation
+from src.services.system_solver_service import SystemSolverService
+
+def test_circle_and_line_intersection():
+    eq1 = Equation("x^2 + y^2 - 4", variables=('x', 'y'))
+    eq2 = Equation("x - y", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 2
+    np.testing.assert_array_almost_equal(points, [(-np.sqrt(2), -np.sqrt(2)), (np.sqrt(2), np.sqrt(2))])
+
+def test_circle_and_hyperbola_intersection():
+    eq1 = Equation("x^2 + y^2 - 25", variables=('x', 'y'))
+    eq2 = Equation("x^2 - y^2 - 7", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    np.testing.assert_array_almost_equal(points, [(-4, -3), (-4, 3), (4, -3), (4, 3)])
+
+def test_no_system_intersection():
+    eq1 = Equation("x^2 + y^2 - 1", variables=('x', 'y'))
+    eq2 = Equation("x^2 + y^2 - 4", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 0
+
+def test_system_plot_data_shape():
+    eq1 = Equation("y - x^2", variables=('x', 'y'))
+    eq2 = Equation("3", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    x_grid, y_grid, f_vals, g_vals = solver.get_plot_data()
+
+    assert f_vals.shape == x_grid.shape
+    assert g_vals.shape == y_grid.shape
+
+def test_identical_equations_overlap():
+    eq1 = Equation("x - y", variables=('x', 'y'))
+    eq2 = Equation("x - y", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 0
+    assert solver.curves_overlap
+
+def test_proportional_equations_overlap():
+    eq1 = Equation("x - y", variables=('x', 'y'))
+    eq2 = Equation("2*x - 2*y", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 0
+    assert solver.curves_overlap
+
+@pytest.mark.parametrize("expr1, expr2", [
+    ("x - 2*y", "2*x - 4*y"),
+    ("x - 3*y", "x - 3*y"),
+    ("y - 1", "y - 1"),
+    ("x - y - 0.01", "x - y - 0.01"),
+    ("x^2 + y^2 - 4", "2*(x^2 + y^2 - 4)"),
+])
+def test_coincident_curves_overlap(expr1, expr2):
+    eq1 = Equation(expr1, variables=('x', 'y'))
+    eq2 = Equation(expr2, variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 0
+    assert solver.curves_overlap
+
+def test_tangent_intersection():
+    eq1 = Equation("x^2 + y^2 - 1", variables=('x', 'y'))
+    eq2 = Equation("y - 1", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 1
+    np.testing.assert_array_almost_equal(points, [(0, 1)], decimal=5)
+    assert not solver.curves_overlap
+
+def test_touching_zero_without_sign_change():
+    eq1 = Equation("x^2 + y^2", variables=('x', 'y'))
+    eq2 = Equation("x", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 1
+    np.testing.assert_array_almost_equal(points, [(0, 0)])
+
+def test_double_root_along_curve():
+    eq1 = Equation("(x^2 + y^2 - 4)^2", variables=('x', 'y'))
+    eq2 = Equation("x - y", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    points = solver.solve()
+
+    assert len(points) == 2
+    np.testing.assert_array_almost_equal(points, [(-np.sqrt(2), -np.sqrt(2)), (np.sqrt(2), np.sqrt(2))], decimal=5)
+    assert not solver.curves_overlap
+
+def test_mesh_evaluated_once():
+    eq1 = Equation("x^2 + y^2 - 4", variables=('x', 'y'))
+    eq2 = Equation("x - y", variables=('x', 'y'))
+
+    solver = SystemSolverService(eq1, eq2)
+    solver.solve()
+    f_vals = solver.f_values
+    _, _, plot_f_vals, _ = solver.get_plot_data()
+
+    assert plot_f_vals is f_vals